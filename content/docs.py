@@ -14,40 +14,22 @@ st.title("📚 Documentation")
 
 cols = st.columns(2)
 
-pages = [
-    "User Guide",
-    "What's New",
-    "Feature Overview",
-]
+pages = {
+    "User Guide": Path("docs", "user_guide.md"),
+    "What's New": Path("docs", "new.md"),
+    "Feature Overview": Path("docs", "feature_overview.md"),
+}
 
-page = cols[0].selectbox(
-    "**Content**",
-    pages,
-)
-
-#############################################################################################
-# User Guide
-#############################################################################################
 
-if page == pages[0]:
-    with open(Path("docs", "user_guide.md"), "r", encoding="utf-8") as f:
-        content = f.read()
-    st.markdown(content) 
+@st.cache_data
+def load_markdown(path: Path) -> str:
+    """Read a documentation file once per process instead of on every rerun"""
+    return path.read_text(encoding="utf-8")
 
-#############################################################################################
-# What's New
-#############################################################################################
 
-if page == pages[1]:
-    with open(Path("docs", "new.md"), "r", encoding="utf-8") as f:
-        content = f.read()
-    st.markdown(content) 
-
-#############################################################################################
-# Feature Overview
-#############################################################################################
+page = cols[0].selectbox(
+    "**Content**",
+    list(pages),
+)
 
-if page == pages[2]:
-    with open(Path("docs", "feature_overview.md"), "r", encoding="utf-8") as f:
-        content = f.read()
-    st.markdown(content)
\ No newline at end of file
+st.markdown(load_markdown(pages[page]))
@@ -5,9 +5,12 @@ This module provides backend functions for peptide mass spectrometry calculation
 using pyOpenMS. It handles peptide sequence processing, modifications, and m/z calculations.
 """
 
-from typing import Dict, Any, Tuple, Optional
+from typing import Dict, Any, Iterable, List, Tuple, Optional
+from collections import Counter
 from dataclasses import dataclass
+from functools import partial
 import re
+import numpy as np
 
 def _get_pyopenms():
     """Lazy import of pyOpenMS to avoid loading issues.
@@ -42,10 +45,49 @@ ERROR_MESSAGES = {
     'unexpected_error': "An unexpected error occurred: {error}"
 }
 
+_VALID_AA = frozenset('ACDEFGHIKLMNPQRSTVWYXU')
 
-@dataclass
+# str.translate table deleting every non-letter in the Latin-1 range
+_STRIP_NON_ALPHA = str.maketrans('', '', ''.join(chr(c) for c in range(256) if not chr(c).isalpha()))
+
+# str.translate table deleting every valid amino acid code, anything left over is invalid
+_STRIP_VALID_AA = str.maketrans('', '', ''.join(_VALID_AA))
+
+# Candidate residues for dropdown modifications that are placed on a single site
+_PHOSPHO_RE = re.compile(r'[STY]')
+_METHYL_RE = re.compile(r'[KR]')
+_DEAMID_RE = re.compile(r'[NQ]')
+
+# Notation patterns, shared with the quickstart page's example classifier
+PROFORMA_DELTA_RE = re.compile(r'\[([+-]?\d+(?:\.\d+)?(?:[eE][+-]?\d+)?)\]')
+UNIMOD_RE = re.compile(r'UNIMOD:\d+', re.IGNORECASE)
+TRAILING_CHARGE_RE = re.compile(r'/?(\d+)$')
+
+# A bare mass delta inside brackets, e.g. "+15.9949" or "-1.5e2"
+_MASS_DELTA_TEXT_RE = re.compile(r'[+-]?\d+(?:\.\d+)?(?:[eE][+-]?\d+)?')
+
+_STANDARD_AA = frozenset('ACDEFGHIKLMNPQRSTVWY')
+
+# Elemental composition (C, H, N, O, S) of each standard residue, indexed by ASCII code
+_RESIDUE_COMPOSITION = np.zeros((128, 5), dtype=np.int32)
+for _aa, _composition in {
+    'A': (3, 5, 1, 1, 0), 'C': (3, 5, 1, 1, 1), 'D': (4, 5, 1, 3, 0), 'E': (5, 7, 1, 3, 0),
+    'F': (9, 9, 1, 1, 0), 'G': (2, 3, 1, 1, 0), 'H': (6, 7, 3, 1, 0), 'I': (6, 11, 1, 1, 0),
+    'K': (6, 12, 2, 1, 0), 'L': (6, 11, 1, 1, 0), 'M': (5, 9, 1, 1, 1), 'N': (4, 6, 2, 2, 0),
+    'P': (5, 7, 1, 1, 0), 'Q': (5, 8, 2, 2, 0), 'R': (6, 12, 4, 1, 0), 'S': (3, 5, 1, 2, 0),
+    'T': (4, 7, 1, 2, 0), 'V': (5, 9, 1, 1, 0), 'W': (11, 10, 2, 1, 0), 'Y': (9, 9, 1, 2, 0),
+}.items():
+    _RESIDUE_COMPOSITION[ord(_aa)] = _composition
+
+# Monoisotopic element masses as used by OpenMS, so results match AASequence.getMonoWeight
+_ELEMENT_MONO_MASSES = np.array([12.0, 1.0078250319, 14.003074, 15.994915, 31.97207073])
+_WATER_COMPOSITION = np.array([0, 2, 0, 1, 0], dtype=np.int32)
+_PROTON_MASS = 1.007276466771
+
+
+@dataclass(frozen=True)
 class SequenceAnalysis:
-    """Data class for sequence analysis results"""
+    """Data class for sequence analysis results, immutable so instances can be shared and cached"""
     modification: str = "None"
     modification_detected: bool = False
     charge: int = 2
@@ -67,9 +109,6 @@ def parse_square_bracket_modifications(sequence: str) -> Tuple[str, str]:
             modified_sequence is the sequence converted to pyOpenMS format.
 
     """
-    poms = _get_pyopenms()
-    mod_db = _get_pyopenms_mod_db()
-
     sequence = sequence.strip()
     
     if sequence.startswith('.'):
@@ -88,12 +127,14 @@ def parse_square_bracket_modifications(sequence: str) -> Tuple[str, str]:
         mod_text = mod_text.strip()
         
         # Check if it's a numeric mass delta (ProForma arbitrary mass shift)
-        mass_delta_pattern = r'^[+-]?\d+(?:\.\d+)?(?:[eE][+-]?\d+)?$'
-        if re.match(mass_delta_pattern, mod_text):
+        if _MASS_DELTA_TEXT_RE.fullmatch(mod_text):
             if not mod_text.startswith(('+', '-')):
                 mod_text = '+' + mod_text
             return f"[{mod_text}]"  
         
+        # Only named modifications need pyOpenMS, plain sequences never load it
+        mod_db = _get_pyopenms_mod_db()
+        
         # Try to find modification by UNIMOD accession
         if mod_text.upper().startswith("UNIMOD:"):
             mod_accession = mod_text.upper()
@@ -107,11 +148,9 @@ def parse_square_bracket_modifications(sequence: str) -> Tuple[str, str]:
                     return f"[{'+' if mass_delta >= 0 else ''}{mass_delta}]"
                 return mod_text 
         
-        try:
-            mod = mod_db.getModification(mod_text)
-            return mod.getId() 
-        except Exception:
-            pass 
+        # has() is a plain lookup, unknown names would otherwise raise and log
+        if mod_db.has(mod_text):
+            return mod_db.getModification(mod_text).getId()
         
         return mod_text
     
@@ -179,8 +218,7 @@ def validate_peptide_sequence_with_mods(sequence: str) -> Tuple[bool, str, str,
     try:
         clean_sequence, openms_sequence, charge_state = parse_sequence_with_mods_and_charge(sequence)
         
-        valid_aa = set('ACDEFGHIKLMNPQRSTVWYXU')  
-        is_valid = all(aa in valid_aa for aa in clean_sequence if aa.isalpha())
+        is_valid = not any(c.isalpha() for c in set(clean_sequence) - _VALID_AA)
         
         return is_valid, clean_sequence, openms_sequence, charge_state
     except Exception:
@@ -202,24 +240,101 @@ def validate_peptide_sequence(sequence: str) -> tuple[bool, str]:
     try:
         clean_sequence, _ = parse_square_bracket_modifications(sequence)
         
-        import re
         clean_sequence = re.sub(r'\(([^\)]+)\)', '', clean_sequence)
         
         if clean_sequence.startswith('.'):
             clean_sequence = clean_sequence[1:]
             
-        valid_aa = set('ACDEFGHIKLMNPQRSTVWYXU')
-        is_valid = all(aa in valid_aa for aa in clean_sequence if aa.isalpha())
+        # only letters outside the alphabet make the sequence invalid
+        is_valid = not any(c.isalpha() for c in set(clean_sequence) - _VALID_AA)
         return is_valid, clean_sequence
     except Exception:
-        valid_aa = set('ACDEFGHIKLMNPQRSTVWYXU')
         sequence_clean = sequence.upper()
         sequence_clean = re.sub(r'\[([^\]]+)\]', '', sequence_clean)
         sequence_clean = re.sub(r'\(([^\)]+)\)', '', sequence_clean)
         if sequence_clean.startswith('.'):
             sequence_clean = sequence_clean[1:]
-        sequence_clean = ''.join(c for c in sequence_clean if c.isalpha())
-        return all(aa in valid_aa for aa in sequence_clean), sequence_clean
+        sequence_clean = sequence_clean.translate(_STRIP_NON_ALPHA)
+        if not sequence_clean.isascii():
+            # the table only covers Latin-1, anything beyond it is filtered per character
+            sequence_clean = ''.join(filter(str.isalpha, sequence_clean))
+        return is_valid_amino_acid_sequence(sequence_clean), sequence_clean
+
+
+def _modify_residue(aa: str, mod_id: str, sequence: str) -> str:
+    """Attach a modification to the first occurrence of a residue.
+
+    Args:
+        aa (str): The residue to modify.
+        mod_id (str): The OpenMS modification id.
+        sequence (str): The peptide sequence to modify.
+
+    Returns:
+        str: The modified sequence in OpenMS format.
+
+    """
+    return sequence.replace(aa, f"{aa}({mod_id})", 1)
+
+
+def _modify_first_candidate(pattern: re.Pattern, mod_id: str, sequence: str) -> str:
+    """Attach a modification to the first residue matching a candidate pattern.
+
+    Args:
+        pattern (re.Pattern): Compiled character class of candidate residues.
+        mod_id (str): The OpenMS modification id.
+        sequence (str): The peptide sequence to modify.
+
+    Returns:
+        str: The modified sequence in OpenMS format.
+
+    """
+    # search + slice short-circuits when no candidate is present and skips re.sub's callback machinery
+    match = pattern.search(sequence)
+    if match is None:
+        return sequence
+    site = match.end()
+    return f"{sequence[:site]}({mod_id}){sequence[site:]}"
+
+
+def _modify_n_term(mod_id: str, sequence: str) -> str:
+    """Attach a modification to the N-terminus.
+
+    Args:
+        mod_id (str): The OpenMS modification id.
+        sequence (str): The peptide sequence to modify.
+
+    Returns:
+        str: The modified sequence in OpenMS format.
+
+    """
+    return f".({mod_id}){sequence}"
+
+
+# Dropdown modification name -> function applying it, avoids ModificationsDB lookups
+_MODIFICATION_DISPATCH = {
+    "Oxidation (M)": partial(_modify_residue, "M", "Oxidation"),
+    "Carbamidomethyl (C)": partial(_modify_residue, "C", "Carbamidomethyl"),
+    "Phosphorylation (S/T/Y)": partial(_modify_first_candidate, _PHOSPHO_RE, "Phospho"),
+    "Acetylation (N-term)": partial(_modify_n_term, "Acetyl"),
+    "Methylation (K/R)": partial(_modify_first_candidate, _METHYL_RE, "Methyl"),
+    "Deamidation (N/Q)": partial(_modify_first_candidate, _DEAMID_RE, "Deamidated")
+}
+
+# Dropdown options, "None" first followed by every modification apply_modification supports
+_SUPPORTED_MODIFICATIONS = ("None", *_MODIFICATION_DISPATCH)
+
+
+def is_valid_amino_acid_sequence(sequence: str) -> bool:
+    """Check if a plain sequence contains only valid amino acid codes.
+
+    Args:
+        sequence (str): The sequence to check, without modifications or charge notation.
+
+    Returns:
+        bool: True if every character is one of A, C, D, E, F, G, H, I, K, L, M, N, P, Q, R, S, T, V, W, Y, X, U.
+
+    """
+    return not sequence.translate(_STRIP_VALID_AA)
 
 
 def apply_modification(sequence: str, modification: str) -> str:
@@ -233,39 +348,85 @@ def apply_modification(sequence: str, modification: str) -> str:
         str: The modified sequence in OpenMS format.
 
     """
-    if modification == "None":
-        return sequence
+    modify = _MODIFICATION_DISPATCH.get(modification)
+    return modify(sequence) if modify else sequence
 
-    # Pre-defined mapping to avoid ModificationsDB lookups
-    mod_mapping = {
-        "Oxidation (M)": {"id": "Oxidation", "aa": "M"},
-        "Carbamidomethyl (C)": {"id": "Carbamidomethyl", "aa": "C"},
-        "Phosphorylation (S/T/Y)": {"id": "Phospho", "aa": ["S", "T", "Y"]},
-        "Acetylation (N-term)": {"id": "Acetyl", "terminal": "N"},
-        "Methylation (K/R)": {"id": "Methyl", "aa": ["K", "R"]},
-        "Deamidation (N/Q)": {"id": "Deamidated", "aa": ["N", "Q"]}
-    }
 
-    if modification in mod_mapping:
-        mod_info = mod_mapping[modification]
-        mod_id = mod_info["id"]
-
-        if "aa" in mod_info:
-            target_aas = mod_info["aa"] if isinstance(mod_info["aa"], list) else [mod_info["aa"]]
-            modified_sequence = sequence
-            for aa in target_aas:
-                if aa in modified_sequence:
-                    return modified_sequence.replace(aa, f"{aa}({mod_id})", 1)
-            return sequence
-        
-        elif "terminal" in mod_info:
-            if mod_info["terminal"] == "N":
-                return f".({mod_id}){sequence}"
-            elif mod_info["terminal"] == "C":
-                return f"{sequence}({mod_id})."
-            return sequence
-    
-    return sequence
+def _is_standard_sequence(sequence: str) -> bool:
+    """Check if a sequence consists only of the 20 standard amino acids.
+
+    Args:
+        sequence (str): The peptide sequence to check.
+
+    Returns:
+        bool: True if the sequence is non-empty and contains only standard amino acid codes.
+
+    """
+    return bool(sequence) and not (set(sequence) - _STANDARD_AA)
+
+
+def _calculate_unmodified_mz(sequence: str, charge_state: int) -> Tuple[float, float, str]:
+    """Calculate m/z ratio, monoisotopic mass and formula of an unmodified peptide without pyOpenMS.
+
+    Args:
+        sequence (str): The peptide sequence, standard amino acid codes only.
+        charge_state (int): The charge state.
+
+    Returns:
+        Tuple[float, float, str]: A tuple containing (mz_ratio, monoisotopic_mass, molecular_formula).
+
+    """
+    residues = np.frombuffer(sequence.encode('ascii'), dtype=np.uint8)
+    composition = _RESIDUE_COMPOSITION[residues].sum(axis=0) + _WATER_COMPOSITION
+    mono_weight = float(composition @ _ELEMENT_MONO_MASSES)
+    mz_ratio = (mono_weight + charge_state * _PROTON_MASS) / charge_state
+    return mz_ratio, mono_weight, _format_formula(*composition.tolist())
+
+
+def _calculate_unmodified_mz_batch(sequences: List[str], charge_states: List[int]) -> Tuple[List[float], List[float], List[str]]:
+    """Calculate m/z ratios, monoisotopic masses and formulas of many unmodified peptides at once.
+
+    All sequences are packed into one residue buffer and summed per sequence with np.add.reduceat,
+    so the work does not loop over sequences in Python.
+
+    Args:
+        sequences (List[str]): Non-empty peptide sequences, standard amino acid codes only.
+        charge_states (List[int]): The charge state for each sequence.
+
+    Returns:
+        Tuple[List[float], List[float], List[str]]: A tuple containing (mz_ratios, monoisotopic_masses, molecular_formulas).
+
+    """
+    lengths = np.fromiter(map(len, sequences), dtype=np.intp, count=len(sequences))
+    offsets = np.zeros(len(sequences), dtype=np.intp)
+    np.cumsum(lengths[:-1], out=offsets[1:])
+
+    residues = np.frombuffer("".join(sequences).encode('ascii'), dtype=np.uint8)
+    compositions = np.add.reduceat(_RESIDUE_COMPOSITION[residues], offsets, axis=0) + _WATER_COMPOSITION
+    mono_weights = compositions @ _ELEMENT_MONO_MASSES
+    charges = np.asarray(charge_states)
+    mz_ratios = (mono_weights + charges * _PROTON_MASS) / charges
+
+    formulas = [_format_formula(*composition) for composition in compositions.tolist()]
+    return mz_ratios.tolist(), mono_weights.tolist(), formulas
+
+
+def _format_formula(carbon: int, hydrogen: int, nitrogen: int, oxygen: int, sulfur: int) -> str:
+    """Format elemental counts of a peptide as a molecular formula in Hill order.
+
+    Args:
+        carbon (int): Number of carbon atoms.
+        hydrogen (int): Number of hydrogen atoms.
+        nitrogen (int): Number of nitrogen atoms.
+        oxygen (int): Number of oxygen atoms.
+        sulfur (int): Number of sulfur atoms.
+
+    Returns:
+        str: The molecular formula in the same notation as pyOpenMS (e.g., "C39H62N8O17S1").
+
+    """
+    # every residue carries C, H, N and O, so Hill order only has to make sulfur optional
+    return f"C{carbon}H{hydrogen}N{nitrogen}O{oxygen}" + (f"S{sulfur}" if sulfur else "")
 
 
 def calculate_peptide_mz(sequence: str, charge_state: int, modification: str = "None") -> Dict[str, Any]:
@@ -301,76 +462,75 @@ def calculate_peptide_mz(sequence: str, charge_state: int, modification: str = "
     if charge_state < 1:
         raise ValueError("Charge state must be a positive integer")
     
-    poms = _get_pyopenms()
-    
     sequence_no_charge, extracted_charge = parse_charge_notation(sequence)
     
-    # Try direct PyOpenMS parsing first for ProForma sequences
-    proforma_direct = False
-    clean_sequence = None
-    openms_sequence = None
-    
-    try:
-        test_seq = poms.AASequence.fromString(sequence_no_charge)
-        import re
-        clean_sequence = re.sub(r'\[([^\]]+)\]', '', sequence_no_charge)
-        clean_sequence = re.sub(r'\(([^\)]+)\)', '', clean_sequence)
-        if clean_sequence.startswith('.'):
-            clean_sequence = clean_sequence[1:]
-        openms_sequence = sequence_no_charge
-        proforma_direct = True
-    except Exception:
-        clean_sequence, openms_sequence, _ = parse_sequence_with_mods_and_charge(sequence)
-        proforma_direct = False
-    
     final_charge_state = extracted_charge if extracted_charge > 1 else charge_state
     charge_source = "From sequence notation" if extracted_charge > 1 else "From input parameter"
     
-    # Validate amino acids
-    valid_aa = set('ACDEFGHIKLMNPQRSTVWYXU')
-    invalid_chars = [aa for aa in clean_sequence if aa.isalpha() and aa not in valid_aa]
-    if invalid_chars:
-        invalid_list = ', '.join(sorted(set(invalid_chars)))
-        raise ValueError(f"Invalid amino acid(s) found in sequence: {invalid_list}. Valid amino acids are: A, C, D, E, F, G, H, I, K, L, M, N, P, Q, R, S, T, V, W, Y, X, U")
-    
-    non_alpha_chars = [c for c in clean_sequence if not c.isalpha()]
-    if non_alpha_chars:
-        non_alpha_list = ', '.join(sorted(set(non_alpha_chars)))
-        raise ValueError(f"Invalid character(s) found in sequence: {non_alpha_list}. Sequence should contain only amino acid letters. Did you mean to use charge notation (e.g., /2)?")
-    
-    if not all(aa in valid_aa for aa in clean_sequence if aa.isalpha()):
-        raise ValueError(f"Invalid amino acids found in sequence: {clean_sequence}")
-    
-    # Handle modifications
-    if proforma_direct:
-        modified_sequence_str = openms_sequence
-        applied_modification = "ProForma arbitrary mass deltas (direct parsing)"
-    elif openms_sequence != clean_sequence:
-        modified_sequence_str = openms_sequence
-        applied_modification = "From sequence notation (converted)"
+    if modification == "None" and _is_standard_sequence(sequence_no_charge):
+        # Unmodified sequences of standard residues are summed from the residue table, no pyOpenMS needed
+        clean_sequence = modified_sequence_str = sequence_no_charge
+        applied_modification = "None"
+        mz_ratio, mono_weight, formula = _calculate_unmodified_mz(clean_sequence, final_charge_state)
     else:
-        modified_sequence_str = apply_modification(clean_sequence, modification)
-        applied_modification = modification
-    
-    try:
-        aa_sequence_obj = poms.AASequence.fromString(modified_sequence_str)
-    except Exception as e:
-        raise ValueError(f"Failed to parse modified sequence '{modified_sequence_str}': {str(e)}")
-    
-    mz_ratio = aa_sequence_obj.getMZ(final_charge_state)
-    mono_weight = aa_sequence_obj.getMonoWeight()
-    formula = aa_sequence_obj.getFormula()
+        poms = _get_pyopenms()
+
+        # Try direct PyOpenMS parsing first for ProForma sequences
+        proforma_direct = False
+        clean_sequence = None
+        openms_sequence = None
+
+        try:
+            test_seq = poms.AASequence.fromString(sequence_no_charge)
+            clean_sequence = re.sub(r'\[([^\]]+)\]', '', sequence_no_charge)
+            clean_sequence = re.sub(r'\(([^\)]+)\)', '', clean_sequence)
+            if clean_sequence.startswith('.'):
+                clean_sequence = clean_sequence[1:]
+            openms_sequence = sequence_no_charge
+            proforma_direct = True
+        except Exception:
+            clean_sequence, openms_sequence, _ = parse_sequence_with_mods_and_charge(sequence)
+            proforma_direct = False
+
+        # Validate amino acids
+        unexpected_chars = set(clean_sequence) - _VALID_AA
+        invalid_chars = {c for c in unexpected_chars if c.isalpha()}
+        if invalid_chars:
+            invalid_list = ', '.join(sorted(invalid_chars))
+            raise ValueError(f"Invalid amino acid(s) found in sequence: {invalid_list}. Valid amino acids are: A, C, D, E, F, G, H, I, K, L, M, N, P, Q, R, S, T, V, W, Y, X, U")
+
+        non_alpha_chars = unexpected_chars - invalid_chars
+        if non_alpha_chars:
+            non_alpha_list = ', '.join(sorted(non_alpha_chars))
+            raise ValueError(f"Invalid character(s) found in sequence: {non_alpha_list}. Sequence should contain only amino acid letters. Did you mean to use charge notation (e.g., /2)?")
+
+        # Handle modifications
+        if proforma_direct:
+            modified_sequence_str = openms_sequence
+            applied_modification = "ProForma arbitrary mass deltas (direct parsing)"
+        elif openms_sequence != clean_sequence:
+            modified_sequence_str = openms_sequence
+            applied_modification = "From sequence notation (converted)"
+        else:
+            modified_sequence_str = apply_modification(clean_sequence, modification)
+            applied_modification = modification
+
+        try:
+            aa_sequence_obj = poms.AASequence.fromString(modified_sequence_str)
+        except Exception as e:
+            raise ValueError(f"Failed to parse modified sequence '{modified_sequence_str}': {str(e)}")
+
+        mz_ratio = aa_sequence_obj.getMZ(final_charge_state)
+        mono_weight = aa_sequence_obj.getMonoWeight()
+        formula = aa_sequence_obj.getFormula().toString()
     
-    # Calculate amino acid composition
-    aa_composition = {}
-    for aa_char in clean_sequence:
-        if aa_char.isalpha():
-            aa_composition[aa_char] = aa_composition.get(aa_char, 0) + 1
+    # Calculate amino acid composition (clean_sequence is letters only at this point)
+    aa_composition = dict(Counter(clean_sequence))
     
     return {
         "mz_ratio": mz_ratio,
         "monoisotopic_mass": mono_weight,
-        "molecular_formula": formula.toString(),
+        "molecular_formula": formula,
         "original_sequence": clean_sequence,
         "modified_sequence": modified_sequence_str,
         "charge_state": final_charge_state,
@@ -382,6 +542,88 @@ def calculate_peptide_mz(sequence: str, charge_state: int, modification: str = "
     }
 
 
+def calculate_peptide_mz_batch(sequences: Iterable[str], charge_state: int, modification: str = "None") -> List[Dict[str, Any]]:
+    """Calculate m/z ratios for a list of peptides.
+
+    Sequences that cannot be calculated are reported with an error message instead of
+    aborting the whole batch.
+
+    Args:
+        sequences (Iterable[str]): The peptide sequences, same notation as calculate_peptide_mz.
+                                   Blank entries are skipped.
+        charge_state (int): The charge state - overridden per sequence by charge notation.
+        modification (str): Modification to apply from dropdown. Defaults to "None".
+
+    Returns:
+        List[Dict[str, Any]]: One row per sequence with the keys sequence, mz_ratio,
+            monoisotopic_mass, charge_state, molecular_formula and error.
+
+    """
+    # bind to locals, the loop runs once per pasted sequence
+    calculate = calculate_peptide_mz
+    parse_charge = parse_charge_notation
+    is_standard = _is_standard_sequence
+    rows = []
+    append = rows.append
+
+    # unmodified rows are collected and calculated together after the loop
+    use_fast_path = modification == "None" and charge_state >= 1
+    fast_rows = []
+    fast_sequences = []
+    fast_charges = []
+
+    for sequence in sequences:
+        sequence = sequence.strip()
+        if not sequence:
+            continue
+        if use_fast_path:
+            sequence_no_charge, extracted_charge = parse_charge(sequence)
+            if is_standard(sequence_no_charge):
+                final_charge_state = extracted_charge if extracted_charge > 1 else charge_state
+                row = {
+                    "sequence": sequence,
+                    "mz_ratio": None,
+                    "monoisotopic_mass": None,
+                    "charge_state": final_charge_state,
+                    "molecular_formula": None,
+                    "error": None
+                }
+                append(row)
+                fast_rows.append(row)
+                fast_sequences.append(sequence_no_charge)
+                fast_charges.append(final_charge_state)
+                continue
+        try:
+            results = calculate(sequence, charge_state, modification)
+        except ValueError as e:
+            append({
+                "sequence": sequence,
+                "mz_ratio": None,
+                "monoisotopic_mass": None,
+                "charge_state": None,
+                "molecular_formula": None,
+                "error": str(e)
+            })
+            continue
+        append({
+            "sequence": sequence,
+            "mz_ratio": results["mz_ratio"],
+            "monoisotopic_mass": results["monoisotopic_mass"],
+            "charge_state": results["charge_state"],
+            "molecular_formula": results["molecular_formula"],
+            "error": None
+        })
+
+    if fast_rows:
+        mz_ratios, mono_weights, formulas = _calculate_unmodified_mz_batch(fast_sequences, fast_charges)
+        for row, mz_ratio, mono_weight, formula in zip(fast_rows, mz_ratios, mono_weights, formulas):
+            row["mz_ratio"] = mz_ratio
+            row["monoisotopic_mass"] = mono_weight
+            row["molecular_formula"] = formula
+
+    return rows
+
+
 def get_supported_modifications() -> list:
     """Get a list of supported peptide modifications.
 
@@ -389,17 +631,7 @@ def get_supported_modifications() -> list:
         list: A list of supported modification names including "None".
 
     """
-    common_modifications = [
-        "None",
-        "Oxidation (M)",
-        "Carbamidomethyl (C)", 
-        "Phosphorylation (S/T/Y)",
-        "Acetylation (N-term)",
-        "Methylation (K/R)",
-        "Deamidation (N/Q)"
-    ]
-    
-    return common_modifications
+    return list(_SUPPORTED_MODIFICATIONS)
 
 
 def get_modification_info() -> Dict[str, str]:
@@ -541,25 +773,13 @@ def parse_charge_notation(sequence: str) -> Tuple[str, int]:
         leading_dot = "."
         sequence = sequence[1:]
     
-    # Try /charge format first
-    slash_charge_pattern = r'/(\d+)$'
-    slash_match = re.search(slash_charge_pattern, sequence)
+    # /charge or a plain trailing number, both are removed with the charge
+    charge_match = TRAILING_CHARGE_RE.search(sequence)
     
-    if slash_match:
-        charge_state = int(slash_match.group(1))
+    if charge_match:
+        charge_state = int(charge_match.group(1))
         if 1 <= charge_state <= 20:
-            sequence_without_charge = re.sub(slash_charge_pattern, '', sequence)
-            return leading_dot + sequence_without_charge, charge_state
-    
-    # Try trailing number as charge
-    trailing_number_pattern = r'(\d+)$'
-    number_match = re.search(trailing_number_pattern, sequence)
-    
-    if number_match:
-        charge_state = int(number_match.group(1))
-        if 1 <= charge_state <= 20:
-            sequence_without_charge = re.sub(trailing_number_pattern, '', sequence)
-            return leading_dot + sequence_without_charge, charge_state
+            return leading_dot + sequence[:charge_match.start()], charge_state
     
     return leading_dot + sequence, 1
 
@@ -621,7 +841,7 @@ def detect_modification_from_sequence(sequence: str) -> str:
             return dropdown_name
     
     # Check for mass deltas using ModificationsDB
-    mass_delta_match = re.search(r'\[([+-]?\d+(?:\.\d+)?(?:[eE][+-]?\d+)?)\]', openms_sequence)
+    mass_delta_match = PROFORMA_DELTA_RE.search(openms_sequence)
     if mass_delta_match:
         try:
             mass_delta = float(mass_delta_match.group(1))
@@ -646,9 +866,6 @@ def _match_mass_delta_to_modification(mass_delta: float, tolerance: float = 0.01
 
     """
     try:
-        mod_db = _get_pyopenms_mod_db()
-        poms = _get_pyopenms()
-        
         # modification names and their known mass deltas
         known_mods = {
             "Carbamidomethyl (C)": [57.021464, 57.0214, 57.02, 57.0],
@@ -666,6 +883,7 @@ def _match_mass_delta_to_modification(mass_delta: float, tolerance: float = 0.01
                     return mod_name
         
         # if not found, check ModificationsDB
+        mod_db = _get_pyopenms_mod_db()
         mod_id_to_dropdown = {
             "Oxidation": "Oxidation (M)",
             "Carbamidomethyl": "Carbamidomethyl (C)",
@@ -742,39 +960,38 @@ def analyze_peptide_sequence(sequence: str) -> SequenceAnalysis:
             - error_message: Error message if validation failed
 
     """
-    analysis = SequenceAnalysis()
-    
     if not sequence or not sequence.strip():
-        analysis.is_valid = False
-        analysis.error_message = ERROR_MESSAGES['empty_sequence']
-        return analysis
+        return SequenceAnalysis(is_valid=False, error_message=ERROR_MESSAGES['empty_sequence'])
+    
+    # SequenceAnalysis is frozen, collect the detected fields and build it once
+    fields = {}
     
     try:
         _, _, extracted_charge = parse_sequence_with_mods_and_charge(sequence)
         if extracted_charge > 1:
-            analysis.charge = extracted_charge
-            analysis.charge_detected = True
+            fields["charge"] = extracted_charge
+            fields["charge_detected"] = True
         
         detected_modification = detect_modification_from_sequence(sequence)
         if detected_modification != "None":
-            analysis.modification = detected_modification
-            analysis.modification_detected = True
+            fields["modification"] = detected_modification
+            fields["modification_detected"] = True
             
         is_valid, clean_sequence = validate_peptide_sequence(sequence)
-        analysis.is_valid = is_valid
-        analysis.clean_sequence = clean_sequence
+        fields["is_valid"] = is_valid
+        fields["clean_sequence"] = clean_sequence
         
         if not is_valid:
-            analysis.error_message = ERROR_MESSAGES['invalid_amino_acid']
+            fields["error_message"] = ERROR_MESSAGES['invalid_amino_acid']
         elif len(clean_sequence) == 0:
-            analysis.error_message = ERROR_MESSAGES['invalid_sequence_length']
-            analysis.is_valid = False
+            fields["error_message"] = ERROR_MESSAGES['invalid_sequence_length']
+            fields["is_valid"] = False
             
     except Exception as e:
-        analysis.is_valid = False
-        analysis.error_message = ERROR_MESSAGES['unexpected_error'].format(error=str(e))
+        fields["is_valid"] = False
+        fields["error_message"] = ERROR_MESSAGES['unexpected_error'].format(error=str(e))
     
-    return analysis
+    return SequenceAnalysis(**fields)
 
 
 def get_cached_modifications():
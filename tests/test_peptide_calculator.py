@@ -0,0 +1,106 @@
+import importlib
+import sys
+from dataclasses import FrozenInstanceError
+
+import pytest
+
+import src.peptide_calculator as peptide_calculator
+from src.peptide_calculator import (
+    analyze_peptide_sequence,
+    calculate_peptide_mz,
+    calculate_peptide_mz_batch,
+    is_valid_amino_acid_sequence,
+    validate_peptide_sequence,
+)
+
+"""
+Tests for the peptide m/z calculator backend.
+"""
+
+
+@pytest.fixture
+def poms(monkeypatch):
+    """Real pyOpenMS, other test modules replace it in sys.modules with a mock."""
+    monkeypatch.delitem(sys.modules, "pyopenms", raising=False)
+    real_pyopenms = importlib.import_module("pyopenms")
+    monkeypatch.setitem(sys.modules, "pyopenms", real_pyopenms)
+    # the backend caches ModificationsDB on first use, drop whatever it picked up
+    monkeypatch.setattr(peptide_calculator, "_mod_db_cache", None)
+    return real_pyopenms
+
+
+@pytest.mark.usefixtures("poms")
+def test_batch_matches_single_calculation():
+    """Each batch row should carry the same values as a single calculation."""
+    sequences = ["PEPTIDE", "M[Oxidation]PEPTIDE/3", "ACDEFGHIKLMNPQRSTVWY/3", "QVVPC[+57.021464]STSER2", "MCWK4"]
+    rows = calculate_peptide_mz_batch(sequences, 2)
+
+    assert len(rows) == len(sequences)
+    for sequence, row in zip(sequences, rows):
+        expected = calculate_peptide_mz(sequence, 2)
+        assert row["sequence"] == sequence
+        assert row["mz_ratio"] == pytest.approx(expected["mz_ratio"])
+        assert row["monoisotopic_mass"] == pytest.approx(expected["monoisotopic_mass"])
+        assert row["charge_state"] == expected["charge_state"]
+        assert row["molecular_formula"] == expected["molecular_formula"]
+        assert row["error"] is None
+
+
+@pytest.mark.usefixtures("poms")
+def test_batch_reports_invalid_rows_and_skips_blank_lines():
+    """Invalid sequences get an error message, blank lines are ignored."""
+    rows = calculate_peptide_mz_batch(["PEPTIDE", "   ", "PEPBTIDE"], 2)
+
+    assert [row["sequence"] for row in rows] == ["PEPTIDE", "PEPBTIDE"]
+    assert rows[0]["error"] is None
+    assert rows[1]["mz_ratio"] is None
+    assert "B" in rows[1]["error"]
+
+
+@pytest.mark.parametrize(
+    "sequence,charge",
+    [("PEPTIDE", 1), ("PEPTIDE", 2), ("ACDEFGHIKLMNPQRSTVWY", 3), ("MCWK", 4)],
+)
+def test_unmodified_fast_path_matches_pyopenms(poms, sequence, charge):
+    """Unmodified sequences bypass pyOpenMS but must give identical results."""
+    results = calculate_peptide_mz(sequence, charge)
+    expected = poms.AASequence.fromString(sequence)
+
+    assert results["mz_ratio"] == pytest.approx(expected.getMZ(charge), abs=1e-9)
+    assert results["monoisotopic_mass"] == pytest.approx(expected.getMonoWeight(), abs=1e-9)
+    assert results["molecular_formula"] == expected.getFormula().toString()
+    assert results["modification"] == "None"
+
+
+@pytest.mark.usefixtures("poms")
+def test_analysis_detects_modification_and_charge():
+    """Modification and charge notation are detected, and the result is immutable."""
+    analysis = analyze_peptide_sequence("M[Oxidation]PEPTIDE/3")
+
+    assert analysis.modification == "Oxidation (M)"
+    assert analysis.modification_detected
+    assert analysis.charge == 3
+    assert analysis.charge_detected
+    assert analysis.is_valid
+    with pytest.raises(FrozenInstanceError):
+        analysis.charge = 2
+
+
+@pytest.mark.parametrize(
+    "sequence,expected",
+    [("PEPTIDE", True), ("ACDEFGHIKLMNPQRSTVWYXU", True), ("PEPBTIDE", False), ("peptide", False), ("PEP/2", False)],
+)
+def test_valid_amino_acid_sequence(sequence, expected):
+    """Only the supported one-letter codes are accepted."""
+    assert is_valid_amino_acid_sequence(sequence) is expected
+
+
+def test_validation_fallback_drops_every_non_letter(monkeypatch):
+    """The fallback path keeps only letters, also for characters beyond Latin-1."""
+    def fail_to_parse(sequence):
+        raise RuntimeError("unparsable")
+
+    monkeypatch.setattr(peptide_calculator, "parse_square_bracket_modifications", fail_to_parse)
+
+    assert validate_peptide_sequence("PEP—TIDE🧪/2") == (True, "PEPTIDE")
+    assert validate_peptide_sequence("PEP-ÉTIDE") == (False, "PEPÉTIDE")